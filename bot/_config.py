@@ -5,6 +5,34 @@ import sys
 import yaml
 import pydantic
 
+from typing import Any
+
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _Dumper
+
+
+def _env(key: str, **kwargs) -> Any:
+    """Default a field to the value of the environment variable `key`.
+
+    The variable is read when the config is created, not when this module is
+    imported. Empty variables are treated as unset. Additional keyword
+    arguments are passed to `pydantic.Field`.
+    """
+    return pydantic.Field(
+        default_factory=lambda: os.environ.get(key) or None, **kwargs
+    )
+
+
+def _test_mode() -> bool:
+    """Determine if the test mode is enabled via `TEST_MODE`."""
+
+    # The != "false" condition prevents the test mode from accidentally being
+    # turned off, for example through a typo. Everything which is not
+    # "false" will resolve to "true" and thus enable the test mode.
+    return os.environ.get("TEST_MODE", "true").casefold() != "false"
+
 
 class BaseConfig(pydantic.BaseModel):
     """Shared configuration."""
@@ -17,17 +45,15 @@ class BaseConfig(pydantic.BaseModel):
 class ProducerConfig(BaseConfig):
     """Producer configuration."""
 
-    max_work_items: int | None = os.environ.get("MAX_WORK_ITEMS")
+    # Validate the default to parse the env var to an int once
+    max_work_items: int | None = _env("MAX_WORK_ITEMS", validate_default=True)
     """Maximum amount of work items created by the Producer."""
 
 
 class ConsumerConfig(BaseConfig):
     """Consumer configuration."""
 
-    # The != "false" condition prevents the test mode from accidentally being
-    # turned off, for example through a typo. Everything which is not
-    # "false" will resolve to "true" and thus enable the test mode.
-    test_mode: bool = os.environ.get("TEST_MODE", "true").lower() != "false"
+    test_mode: bool = pydantic.Field(default_factory=_test_mode)
     """
     If enabled, the bot does not perform any "critical" actions, such as
     sending e-mails, or inserting data in applications.
@@ -38,22 +64,23 @@ class ConsumerConfig(BaseConfig):
 class ReporterConfig(BaseConfig):
     """Reporter configuration."""
 
-    # The != "false" condition prevents the test mode from accidentally being
-    # turned off, for example through a typo. Everything which is not
-    # "false" will resolve to "true" and thus enable the test mode.
-    test_mode: bool = os.environ.get("TEST_MODE", "true").lower() != "false"
+    test_mode: bool = pydantic.Field(default_factory=_test_mode)
     """
     If enabled, report e-mail will only be stored as draft.
     Per default, test mode is enabled.
     """
 
-    recipients: str = os.environ.get("RECIPIENT")
+    recipients: str = _env("RECIPIENT")
     """E-Mail or list of semicolon-separated e-mails of report recipients."""
 
-    contact: str = os.environ.get("CONTACT")
+    contact: str = _env("CONTACT")
     """Contact person at Aconio."""
 
 
 def dump(config: BaseConfig) -> None:
     """Print the configuration."""
-    yaml.dump(config.model_dump(exclude_unset=True), sys.stdout)
+    yaml.dump(
+        config.model_dump(mode="json", exclude_unset=True),
+        sys.stdout,
+        Dumper=_Dumper,
+    )
@@ -1,8 +1,31 @@
 """Specification of the work item passed to Robocorp Control Room."""
 
+from typing import Any, TypedDict
+
 import pydantic
 
 
 class Item(pydantic.BaseModel):
     """A work item created by the Producer and processed by the Consumer."""
-    pass
+
+    # Work items are read-only once created. The validation schema is only
+    # built on first use, so processes which never create an `Item` (e.g. the
+    # Reporter) don't pay for it at import time.
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+
+
+class ReporterItem(TypedDict):
+    """A work item created for the Reporter by `attach_reporter`.
+
+    Reporter items are passed on as plain dictionaries, so no model is built
+    when they are created by the Consumer or read by the Reporter.
+    """
+
+    failed_wi_id: str
+    """ID of the Consumer work item which raised the `BusinessError`."""
+
+    failed_wi_code: str
+    """Code of the raised `BusinessError`."""
+
+    failed_wi_payload: dict[str, Any]
+    """Payload of the failed Consumer work item (see `Item`)."""
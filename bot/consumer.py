@@ -7,7 +7,7 @@ from aconio.core import decorators
 from bot import _items, _config
 
 
-@functools.lru_cache
+@functools.lru_cache(maxsize=1)
 def config() -> _config.ConsumerConfig:
     return _config.ConsumerConfig()
 
@@ -7,7 +7,7 @@ from robocorp import log
 from bot import _items, _config
 
 
-@functools.lru_cache
+@functools.lru_cache(maxsize=1)
 def config() -> _config.ProducerConfig:
     return _config.ProducerConfig()
 
@@ -29,11 +29,11 @@ def run() -> list[_items.Item]:
 
     # TODO: Implement producer
 
-    if config().max_work_items:
+    max_work_items = config().max_work_items
+    if max_work_items is not None:
         log.warn(
-            "Max work items set - only creating "
-            f"{config().max_work_items} work items!"
+            f"Max work items set - only creating {max_work_items} work items!"
         )
-        return work_items[: int(config().max_work_items)]
+        return work_items[: int(max_work_items)]
     else:
         return work_items
@@ -9,28 +9,40 @@ from datetime import datetime
 from aconio import outlook
 from aconio.core import decorators
 
-from robocorp import workitems
+from robocorp import log, workitems
 
-from bot import _config
+from bot import _items, _config
 
 
-@functools.lru_cache
+# Determine which error code of the `BusinessError` will result in which
+# message in the reporter e-mail.
+# pylint: disable=line-too-long
+_CODES = {
+    "ERROR_MSG": "Fehlermeldung.",  # TODO: Add required error codes
+}
+# pylint: enable=line-too-long
+
+
+@functools.lru_cache(maxsize=1)
 def config() -> _config.ReporterConfig:
     return _config.ReporterConfig()
 
 
 @functools.lru_cache
-def jinja() -> j2.Environment:
-    return j2.Environment()
+def jinja(templates_dir: str = "templates") -> j2.Environment:
+    # Templates don't change during a robot run, so skip the up-to-date check
+    # on each render and keep compiled templates on disk across runs
+    return j2.Environment(
+        loader=j2.FileSystemLoader(templates_dir),
+        undefined=j2.StrictUndefined,
+        auto_reload=False,
+        bytecode_cache=j2.FileSystemBytecodeCache(),
+    )
 
 
 def setup() -> None:
     """Setup reporter process."""
-
-    outlook.start(minimize=True)
-
-    jinja().loader = j2.FileSystemLoader("templates")
-    jinja().undefined = j2.StrictUndefined
+    pass
 
 
 def teardown() -> None:
@@ -41,6 +53,14 @@ def teardown() -> None:
 def run(items: list[workitems.Input]):
     """Send a process report for failed work items."""
 
+    if not items:
+        log.info("No failed work items, skipping process report.")
+        return
+
+    # Outlook is only started once it is clear that a report will be sent
+    if not outlook.is_open():
+        outlook.start(minimize=True)
+
     content = generate_report(
         items=items,
         contact=config().contact,
@@ -76,25 +96,13 @@ def generate_report(
             Formatted process report.
     """
 
-    # Determine which error code of the `BusinessError` will result in which
-    # message in the reporter e-mail.
-    # pylint: disable=line-too-long
-    codes = {
-        "ERROR_MSG": "Fehlermeldung.",  # TODO: Add required error codes
-    }
-
-    infos = {
-        i.payload["failed_wi_payload"]["client"]["bmd_number"]: codes[
-            i.payload["failed_wi_code"]
-        ]
-        for i in items
-    }
-
-    return (
-        jinja()
-        .get_template("report.j2")
-        .render(
-            infos=infos,
-            contact=contact,
-        )
+    infos = {}
+    for i in items:
+        payload: _items.ReporterItem = i.payload
+        client_id = payload["failed_wi_payload"]["client"]["bmd_number"]
+        infos[client_id] = _CODES[payload["failed_wi_code"]]
+
+    return jinja().get_template("report.j2").render(
+        infos=infos,
+        contact=contact,
     )
@@ -49,7 +49,7 @@ from aconio import outlook
 from aconio.alerts import _config
 
 
-@lru_cache  # Always return the same instance.
+@lru_cache(maxsize=1)  # Always return the same instance.
 def config() -> _config.Config:
     return _config.Config()
 
@@ -2,6 +2,8 @@
 
 import os
 
+from concurrent.futures import ThreadPoolExecutor
+
 from azure.storage.fileshare import (
     ShareDirectoryClient,
     ShareFileClient,
@@ -46,6 +48,32 @@ def download_storage_dir(
         RuntimeError:
             If the directory is empty and `raise_on_empty` is `True`.
     """
+    files = _list_storage_files(
+        storage_dir_path=storage_dir_path,
+        output_path=output_path,
+        auth=auth,
+        raise_on_empty=raise_on_empty,
+    )
+
+    # Downloads are dominated by network latency, so fetch files in parallel.
+    # Each call to `download_file` uses its own `ShareFileClient`.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda f: download_file(*f, auth=auth), files))
+
+
+def _list_storage_files(
+    storage_dir_path: str,
+    output_path: str,
+    auth: Auth,
+    raise_on_empty: bool = False,
+) -> list[tuple[str, str, str]]:
+    """Recursively list all files of an Azure file share directory.
+
+    Also creates the output directories for all sub-directories.
+
+    Returns:
+        List of `(storage_dir_path, file_name, output_path)` tuples.
+    """
     client = ShareDirectoryClient(
         account_url=auth.account_url,
         share_name=auth.share_name,
@@ -62,6 +90,7 @@ def download_storage_dir(
     if len(items) == 0 and raise_on_empty:
         raise RuntimeError(f"Directory '{storage_dir_path}' is empty.")
 
+    files = []
     for item in items:
         item_name = item.get("name")
 
@@ -71,13 +100,17 @@ def download_storage_dir(
 
             os.makedirs(sub_output_path, exist_ok=True)
 
-            download_storage_dir(
-                storage_dir_path=sub_storage_dir_path,
-                output_path=sub_output_path,
-                auth=auth,
+            files.extend(
+                _list_storage_files(
+                    storage_dir_path=sub_storage_dir_path,
+                    output_path=sub_output_path,
+                    auth=auth,
+                )
             )
         else:
-            download_file(storage_dir_path, item_name, output_path, auth)
+            files.append((storage_dir_path, item_name, output_path))
+
+    return files
 
 
 def download_file(
@@ -102,6 +135,6 @@ def download_file(
         file_path=os.path.join(storage_dir_path, file_name),
     )
 
+    # Write the file chunk by chunk instead of buffering it in memory
     with open(os.path.join(output_path, file_name), "wb") as data:
-        stream = client.download_file()
-        data.write(stream.readall())
+        client.download_file().readinto(data)
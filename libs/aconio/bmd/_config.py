@@ -33,16 +33,13 @@ class ExecutableType(enum.StrEnum):
             value:
                 Must either be 'NTCS' or 'EXEC'.
         """
-        match value:
-            case "NTCS":
-                return ExecutableType.NTCS
-            case "EXEC":
-                return ExecutableType.EXEC
-            case _:
-                raise ValueError(
-                    f"Invalid BMD executable type '{value}'! "
-                    "Please use 'NTCS' or 'EXEC'."
-                )
+        try:
+            return cls[value]  # Lookup by member name, e.g. 'NTCS'
+        except KeyError as exc:
+            raise ValueError(
+                f"Invalid BMD executable type '{value}'! "
+                "Please use 'NTCS' or 'EXEC'."
+            ) from exc
 
 
 def _get_log_dir() -> str:
@@ -80,8 +77,14 @@ class Config:
     Path to the temporary robot directory for storing generated files.
     """
 
-    ntcs_dir: str = os.environ.get("BMDNTCSDIR")
-    """Path the the BMDNTCS and BMDExec executables."""
+    ntcs_dir: str | None = dataclasses.field(
+        default_factory=lambda: os.environ.get("BMDNTCSDIR")
+    )
+    """
+    Path the the BMDNTCS and BMDExec executables.
+
+    Defaults to the `BMDNTCSDIR` env var at the time the config is created.
+    """
 
     ntcs_window_locator: str = 'subname:"BMD - Software"'
     """The `robocorp.windows` locator to identify the main BMD window."""
@@ -129,6 +132,6 @@ class Config:
             )
 
 
-@functools.lru_cache
+@functools.lru_cache(maxsize=1)
 def config() -> Config:
     return Config()
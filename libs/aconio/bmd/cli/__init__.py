@@ -132,9 +132,9 @@ class BMDExecutable:
 
         cmd_str = " ".join(cmd)
         log.info(f"Running BMD CLI command: {cmd_str}")
-        subprocess.run(rf"{cmd_str}", check=True)
+        subprocess.run(cmd_str, check=True)
 
 
-@functools.lru_cache
+@functools.lru_cache(maxsize=1)
 def ntcs_cli() -> BMDExecutable:
     return BMDExecutable(config().ntcs_dir, config().ntcs_exec_type)
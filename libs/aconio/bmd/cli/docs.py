@@ -13,6 +13,10 @@ from aconio.bmd.cli import _utils
 from aconio.bmd._config import config, ExecutableType
 
 
+_SUCCESS_POPUP = 'name:"Achtung" class:TBMDMessageBoxFRM'
+_SUCCESS_POPUP_OK_BUTTON = 'name:"Ok" class:TButton'
+
+
 @dataclasses.dataclass
 class DMSDocument:
     """A BMD DMS document."""
@@ -43,7 +47,9 @@ class DMSDocument:
     employee_company_id: str | None = None
     """BMD company ID the employee belongs to."""
 
-    archive_date: str = datetime.today().strftime("%Y%m%d")
+    archive_date: str = dataclasses.field(
+        default_factory=lambda: datetime.today().strftime("%Y%m%d")
+    )
     """Date the document was archived (format 'YYYYMMDD')."""
 
     def __post_init__(self):
@@ -57,33 +63,34 @@ class DMSDocument:
                 "'employee_id' mandatory if 'employee_company_id' is set"
             )
 
-        self.path = os.path.abspath(self.path)
+        # `normpath` gives the same result as `abspath` for absolute paths,
+        # without looking up the current working directory. Paths without a
+        # drive (e.g. '\\dir\\file.pdf') count as absolute on Windows, but
+        # still need `abspath` to add the drive required by the BMD import.
+        if os.path.splitdrive(self.path)[0] and os.path.isabs(self.path):
+            self.path = os.path.normpath(self.path)
+        else:
+            self.path = os.path.abspath(self.path)
 
     def bmddocs_row(self) -> str:
         """Return the document as a row usable for a 'bmddocs.dok' import."""
 
-        # Empty strings represent fields not needed for the import
-        row_items = [
-            self.archive_id,
-            self.client_id,
-            "",
-            self.category,
-            self.path,
-            self.name,
-            "",
-            "",
-            "",
-            self.archive_date,
-        ]
-
-        suffix = f"$EOD$DOCSPERSFIRMENNR={self.client_company_id}$EOD$"
+        # Empty fields are not needed for the import
+        row = (
+            f"{self.archive_id};{self.client_id};;{self.category};"
+            f"{self.path};{self.name};;;;{self.archive_date}"
+        )
+
+        row = f"{row}$EOD$DOCSPERSFIRMENNR={self.client_company_id}$EOD$"
 
         # Add 'Sachbearbeiter'
         if self.employee_id:
-            suffix += f"DOK_MITARBEITERID={self.employee_id}$EOD$"
-            suffix += f"DOK_MIT_FIRMENNR={self.employee_company_id}$EOD$"
+            row = (
+                f"{row}DOK_MITARBEITERID={self.employee_id}$EOD$"
+                f"DOK_MIT_FIRMENNR={self.employee_company_id}$EOD$"
+            )
 
-        return ";".join(row_items) + suffix
+        return row
 
 
 def _documents_to_dok(
@@ -115,14 +122,14 @@ def _documents_to_dok(
         for k, v in optional.items():
             optional_args += f"{k}={v}$EOD$"
 
-    lines = []
-    for doc in docs:
-        line = f"{doc.bmddocs_row()}$EOD${optional_args}"
-        log.info(f"Adding line to 'bmddocs.dok' import file: '{line}'")
-        lines.append(line)
+    # Write lines as they are built instead of joining all of them first.
+    # Lines are separated (not terminated) by newlines, as before.
+    with open(file, "w", buffering=1 << 16) as f:
+        for i, doc in enumerate(docs):
+            line = f"{doc.bmddocs_row()}$EOD${optional_args}"
+            f.write(f"\n{line}" if i else line)
 
-    with open(file, "w") as f:
-        f.write("\n".join(lines))
+    log.info(f"Added {len(docs)} line(s) to 'bmddocs.dok' import file: {file}")
 
 
 def open_dms_document(doc_id: str, archive_id: str) -> None:
@@ -170,6 +177,6 @@ def import_bmddocs(
     # function execution was successful. If the pop-up cannot be found, it
     # indicates that something went wrong with the executed function.
     if config().ntcs_exec_type == ExecutableType.EXEC:
-        bmd.bmd_window().find('name:"Achtung" class:TBMDMessageBoxFRM').find(
-            'name:"Ok" class:TButton'
+        bmd.bmd_window().find(_SUCCESS_POPUP).find(
+            _SUCCESS_POPUP_OK_BUTTON
         ).click()
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import os
 import re
+import functools
 
 from robocorp import log
-from datetime import datetime
+from typing import ClassVar
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class BMDLogEntry:
     """An entry within a BMD log file."""
 
@@ -22,11 +24,17 @@ class BMDLogEntry:
     sid: str
     message: str
 
-    _line_pattern: re.Pattern = re.compile(
-        r"(?P<date>.*) (?P<time>.*) SU:(?P<username>.*) BU:(?P<db_user>.*) "
-        r"C:(?P<computer>.*) P:(?P<pid>.*) SI:(?P<sid>.*) S:\d* (?P<message>.*)"
+    _line_pattern: ClassVar[re.Pattern] = re.compile(
+        r"(?P<date>\S+) (?P<time>\S+) SU:(?P<username>.*?) "
+        r"BU:(?P<db_user>\S*) C:(?P<computer>\S*) P:(?P<pid>\S*) "
+        r"SI:(?P<sid>\S*) S:\d* (?P<message>.*)"
     )
-    """Regex pattern to parse a line of a BMD log file."""
+    """Regex pattern to parse a line of a BMD log file.
+
+    Only the username (which may contain spaces) and the message are allowed
+    to contain spaces. This keeps the regex engine from backtracking through
+    every combination of column boundaries on lines which don't match.
+    """
 
     @property
     def age(self) -> int:
@@ -43,22 +51,15 @@ class BMDLogEntry:
                 The logfile line string to be intrepreted.
         """
 
-        if match := cls._line_pattern.search(line.strip()):
-            groups = match.groupdict()  # Extract capture groups
-
-            timestamp = datetime.strptime(
-                f'{groups["date"]} {groups["time"]}',
-                "%d.%m.%Y %H:%M:%S,%f",
-            )
-
+        if match := cls._line_pattern.match(line.strip()):
             return BMDLogEntry(
-                timestamp=timestamp,
-                username=groups["username"],
-                db_user=groups["db_user"],
-                computer=groups["computer"],
-                pid=groups["pid"],
-                sid=groups["sid"],
-                message=groups["message"],
+                timestamp=_parse_timestamp(match["date"], match["time"]),
+                username=match["username"],
+                db_user=match["db_user"],
+                computer=match["computer"],
+                pid=match["pid"],
+                sid=match["sid"],
+                message=match["message"],
             )
 
         else:
@@ -68,6 +69,75 @@ class BMDLogEntry:
             )
 
 
+def _parse_timestamp(date: str, time: str) -> datetime:
+    """Parse the date ('DD.MM.YYYY') and time ('HH:MM:SS,ffffff') of a BMD log
+    line.
+
+    Equivalent to `datetime.strptime` with `"%d.%m.%Y %H:%M:%S,%f"`, but
+    avoids its costly format string interpretation for every log line.
+
+    Raises:
+        ValueError: If the date or time is malformed.
+    """
+    year, month, day = _parse_date(date)
+    clock, fraction = time.split(",")
+    hour, minute, second = clock.split(":")
+
+    return datetime(
+        year,
+        month,
+        day,
+        _parse_digits(hour, 2),
+        _parse_digits(minute, 2),
+        _parse_digits(second, 2),
+        # Fraction is right-padded like '%f'
+        _parse_digits(fraction, 1, 6, pad=6),
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_date(date: str) -> tuple[int, int, int]:
+    """Parse a 'DD.MM.YYYY' date into a `(year, month, day)` tuple.
+
+    Consecutive log lines mostly share the same date, so the result is cached.
+    """
+    day, month, year = date.split(".")
+    return (
+        _parse_digits(year, 4),
+        _parse_digits(month, 2),
+        _parse_digits(day, 2),
+    )
+
+
+def _parse_digits(
+    value: str, min_len: int, max_len: int | None = None, pad: int = 0
+) -> int:
+    """Parse a fixed-width run of decimal digits.
+
+    Unlike plain `int`, signs, underscores and whitespace are rejected.
+
+    Args:
+        value:
+            The digits to parse.
+        min_len:
+            Minimum number of digits.
+        max_len:
+            Maximum number of digits. Defaults to `min_len`.
+        pad:
+            Right-pad the digits with zeros to this length before parsing.
+
+    Raises:
+        ValueError: If `value` is not a digit string of the expected length.
+    """
+    if not (
+        value.isascii()
+        and value.isdigit()
+        and min_len <= len(value) <= (max_len or min_len)
+    ):
+        raise ValueError(f"Invalid timestamp part: '{value}'")
+    return int(value.ljust(pad, "0"))
+
+
 class BMDLogfile:
     """A BMD log file.
 
@@ -90,8 +160,12 @@ class BMDLogfile:
 
     def check_success(
         self,
-        success_pattern: str = r"Es wurden \d* von \d* Zeilen .* importiert\.",
-        failure_pattern: str = r"Die Daten konnten nicht importiert werden!.*",
+        success_pattern: str | re.Pattern = (
+            r"Es wurden \d* von \d* Zeilen .* importiert\."
+        ),
+        failure_pattern: str | re.Pattern = (
+            r"Die Daten konnten nicht importiert werden!.*"
+        ),
         max_entries: int | None = 30,
         max_message_age: int | None = 300,
     ) -> bool:
@@ -126,10 +200,12 @@ class BMDLogfile:
 
         Args:
             success_pattern:
-                Regex pattern for identifying a success message. Defaults to
+                Regex pattern (string or compiled) for identifying a success
+                message. Defaults to
                 `Es wurden \\d* von \\d* Zeilen .* importiert\\.`
             failure_pattern:
-                Regex pattern for identifying a failure message. Defaults to
+                Regex pattern (string or compiled) for identifying a failure
+                message. Defaults to
                 `Die Daten konnten nicht importiert werden!.*`
             max_entries:
                 Maximum amount of log file entries to traverse. If `None`, all
@@ -144,10 +220,20 @@ class BMDLogfile:
 
         user = os.environ.get("USERNAME")
 
+        # Compile once instead of looking up the pattern in the `re` module
+        # cache for every entry (already compiled patterns are returned as-is)
+        success_re = re.compile(success_pattern)
+        failure_re = re.compile(failure_pattern)
+
+        # Entries logged before the cutoff are older than `max_message_age`
+        cutoff = None
+        if max_message_age:
+            cutoff = datetime.now() - timedelta(seconds=max_message_age)
+
         entry_cnt = 0
         for entry in self.entries:
-            if max_message_age:
-                if entry.age > max_message_age:
+            if cutoff:
+                if entry.timestamp < cutoff:
                     raise RuntimeError(
                         "Log messages in the given timeframe did not match "
                         "the success, nor the failure criteria!"
@@ -156,9 +242,9 @@ class BMDLogfile:
             if entry.username != user:
                 continue
 
-            if re.match(success_pattern, entry.message):
+            if success_re.match(entry.message):
                 return True
-            elif re.match(failure_pattern, entry.message):
+            elif failure_re.match(entry.message):
                 return False
             else:
                 entry_cnt += 1
@@ -169,7 +255,12 @@ class BMDLogfile:
                     )
 
     @classmethod
-    def from_file(cls, file: str, max_lines: int = 30) -> BMDLogfile:
+    def from_file(
+        cls,
+        file: str,
+        max_lines: int = 30,
+        username: str | None = None,
+    ) -> BMDLogfile:
         """Init a `BMDLogfile` object from a BMD log file.
 
         Args:
@@ -178,14 +269,25 @@ class BMDLogfile:
             max_lines:
                 Maximum amount of lines to read from the log file.
                 Defaults to 30.
+            username:
+                If given, only lines logged by this user are parsed. Lines of
+                other users are skipped (but still count towards `max_lines`)
+                without running the line pattern on them. Defaults to `None`.
         """
 
+        # Cheap substring check to skip other users' lines before the regex
+        user_marker = f" SU:{username} " if username else None
+
         entries = []
         line_cnt = 0
         for line in reverse_readlines(file):
             if line_cnt >= max_lines:
                 break
 
+            if user_marker and user_marker not in line:
+                line_cnt += 1
+                continue
+
             try:
                 entries.append(BMDLogEntry.from_string(line))
             except ValueError:
@@ -199,26 +301,36 @@ class BMDLogfile:
         return BMDLogfile(entries)
 
 
-def reverse_readlines(file: str):
+def reverse_readlines(file: str, chunk_size: int = 64 * 1024):
     """Return a generator yielding each line of the given file in reverse order.
 
+    The file is read backwards in chunks of `chunk_size` bytes, so only the
+    part of the file which is actually consumed by the caller is read. Empty
+    lines are skipped.
+
     Args:
         file:
             Full path to the file which should be read.
+        chunk_size:
+            Amount of bytes read from the file at once. Defaults to 64 KiB.
     """
-    with open(file, "rb") as file:
-        file.seek(0, os.SEEK_END)  # Move to EOF
-        position = file.tell()
-        line = b""
-        while position >= 0:
-            file.seek(position)
-            char = file.read(1)
-            if char == b"\n" or char == b"\r":
+    with open(file, "rb") as f:
+        position = f.seek(0, os.SEEK_END)  # Move to EOF
+        leftover = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+
+            lines = (f.read(read_size) + leftover).splitlines()
+
+            # The first line of the chunk might continue in the previous
+            # chunk, so keep it until that chunk has been read
+            leftover = lines.pop(0) if position > 0 and lines else b""
+
+            for line in reversed(lines):
                 if line:
-                    yield line[::-1].decode("utf-8", errors="replace")
-                line = b""
-            else:
-                line += char
-            position -= 1
-        if line:
-            yield line[::-1].decode("utf-8", errors="replace")
+                    yield line.decode("utf-8", errors="replace")
+
+        if leftover:
+            yield leftover.decode("utf-8", errors="replace")
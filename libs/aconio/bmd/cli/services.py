@@ -3,6 +3,7 @@
 import os
 import csv
 import time
+import functools
 import pydantic
 
 from typing import Annotated
@@ -65,7 +66,9 @@ class BMDService(pydantic.BaseModel):
     recorded_date: Annotated[
         str,
         {"const_id": "MCA_LEI_LEISTUNGSDATUM", "column_name": "Leistungsdatum"},
-    ] = datetime.today().strftime("%d.%m.%Y")
+    ] = pydantic.Field(
+        default_factory=lambda: datetime.today().strftime("%d.%m.%Y")
+    )
     """Date the service was recorded (format 'DD.MM.YYYY')."""
 
     reference_year: Annotated[
@@ -107,29 +110,54 @@ class BMDService(pydantic.BaseModel):
         `{"MCA_LEI_BEZUGSMONAT": 6, "MCA_LEI_LEISTUNGSDATUM": 11.07.2024, ...}`
         """
         return {
-            field.metadata[0]["const_id"]: getattr(self, name)
-            for name, field in self.model_fields.items()
-            if "const_id" in field.metadata[0]
+            metadata["const_id"]: getattr(self, name)
+            for name, metadata in self._bmd_metadata()
+            if "const_id" in metadata
         }
 
     @classmethod
     def bmd_const_ids(cls) -> list[str]:
         """Return a list of BMD Const-IDs for all class properties."""
         return [
-            f.metadata[0]["const_id"]
-            for f in cls.model_fields.values()
-            if "const_id" in f.metadata[0]
+            metadata["const_id"]
+            for _, metadata in cls._bmd_metadata()
+            if "const_id" in metadata
         ]
 
     @classmethod
     def bmd_column_names(cls) -> list[str]:
         """Return a list of BMD column names for all class properties."""
         return [
-            f.metadata[0]["column_name"]
-            for f in cls.model_fields.values()
-            if "column_name" in f.metadata[0]
+            metadata["column_name"]
+            for _, metadata in cls._bmd_metadata()
+            if "column_name" in metadata
+        ]
+
+    @classmethod
+    def bmd_field_names(cls) -> list[str]:
+        """Return the names of all class properties with a BMD Const-ID.
+
+        The names are in the same order as the Const-IDs of `bmd_const_ids`.
+        """
+        return [
+            name
+            for name, metadata in cls._bmd_metadata()
+            if "const_id" in metadata
         ]
 
+    @classmethod
+    @functools.cache
+    def _bmd_metadata(cls) -> tuple[tuple[str, dict[str, str]], ...]:
+        """Return the names and BMD metadata of all class properties.
+
+        The fields of a model don't change, so their metadata is only
+        collected once instead of for every `to_dict` call.
+        """
+        return tuple(
+            (name, field.metadata[0])
+            for name, field in cls.model_fields.items()
+        )
+
 
 def _services_to_csv(services: list[BMDService], file: str) -> None:
     """Write services to a CSV file for BMD 'Standard-CSV' imports.
@@ -148,8 +176,10 @@ def _services_to_csv(services: list[BMDService], file: str) -> None:
     const_ids = BMDService.bmd_const_ids()
     column_names = BMDService.bmd_column_names()
 
+    field_names = BMDService.bmd_field_names()
+
     # pylint: disable=unspecified-encoding
-    with open(file, "w", newline="") as csvfile:
+    with open(file, "w", newline="", buffering=1 << 20) as csvfile:
         writer = csv.writer(
             csvfile, delimiter=";", quotechar='"', quoting=csv.QUOTE_MINIMAL
         )
@@ -162,9 +192,9 @@ def _services_to_csv(services: list[BMDService], file: str) -> None:
         writer.writerow(column_names)
 
         # Write each BMDService object's data as a row in the CSV
-        for s in services:
-            data = s.to_dict()
-            writer.writerow([data[const_id] for const_id in const_ids])
+        writer.writerows(
+            [getattr(s, name) for name in field_names] for s in services
+        )
 
 
 def import_services(services: list[BMDService]) -> None:
@@ -192,7 +222,8 @@ def import_services(services: list[BMDService]) -> None:
 
     # Validate logfile
     logfile = logfiles.BMDLogfile.from_file(
-        os.path.join(config().log_dir, "StdCSVImport.log")
+        os.path.join(config().log_dir, "StdCSVImport.log"),
+        username=os.environ.get("USERNAME"),
     )
     if not logfile.check_success():
         raise RuntimeError("BMD log file indicates failed services import!")
@@ -7,6 +7,11 @@ from aconio.bmd import cli as ntcs_cli
 from aconio.bmd._config import config, ExecutableType
 
 
+_CLOSE_BUTTON = 'name:"Schließen" and control:ButtonControl'
+_CLOSE_POPUP = 'name:"Achtung"'
+_CLOSE_POPUP_EXIT_BUTTON = 'name:"Beenden" and class:TButton'
+
+
 class BMDError(Exception):
     """BMD related error."""
 
@@ -80,14 +85,14 @@ def close_application() -> None:
     """Close the BMD application."""
 
     try:
-        bmd_window().find('name:"Schließen" and control:ButtonControl').click()
+        bmd_window().find(_CLOSE_BUTTON).click()
 
         close_app_popup = windows.desktop().find(
-            'name:"Achtung"', raise_error=False, timeout=4
+            _CLOSE_POPUP, raise_error=False, timeout=4
         )
 
         if close_app_popup is not None:
-            close_app_popup.find('name:"Beenden" and class:TButton').click()
+            close_app_popup.find(_CLOSE_POPUP_EXIT_BUTTON).click()
 
     except windows.ElementNotFound:
         log.warn("Failed to close BMD app, trying to force kill it")
@@ -40,7 +40,7 @@ from functools import lru_cache
 
 
 # This module does not expose the configuration to the outside.
-@lru_cache  # Always return the same instance.
+@lru_cache(maxsize=1)  # Always return the same instance.
 def _config() -> cfg.Config:
     return cfg.Config()
 
@@ -66,8 +66,9 @@ def create(name: str, root: str = tempfile.gettempdir()) -> None:
 
     _config().base_dir = os.path.join(root, name)
 
-    if os.path.exists(_config().base_dir):
-        shutil.rmtree(_config().base_dir)
+    # Empty an existing directory instead of removing and re-creating it
+    if os.path.isdir(_config().base_dir):
+        utils.cleanup_folder(_config().base_dir)
 
     # This also automatically creates the base_dir
     os.makedirs(_config().temp_dir, exist_ok=True)
@@ -172,7 +173,7 @@ def cleanup_temp() -> None:
 
 
 def _check_base_dir():
-    if not _config().base_dir or not os.path.exists(_config().base_dir):
+    if not _config().base_dir or not os.path.isdir(_config().base_dir):
         raise RuntimeError(
             f"Directory {_config().base_dir} does not exist. "
             "Did you call create()?"
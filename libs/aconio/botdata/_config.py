@@ -6,16 +6,29 @@ import os
 class Config:
     """Global configurations available in `aconio.botdata`."""
 
-    base_dir: str = None
+    _base_dir: str = None
+    _config_dir: str = None
+    _temp_dir: str = None
 
     def __init__(self, path: str = None):
         if path:
             self.base_dir = os.path.join(path, "temp")
 
+    @property
+    def base_dir(self) -> str:
+        return self._base_dir
+
+    @base_dir.setter
+    def base_dir(self, value: str) -> None:
+        # Sub-directory paths are joined once here instead of on every access
+        self._base_dir = value
+        self._config_dir = os.path.join(value, "config")
+        self._temp_dir = os.path.join(value, "temp")
+
     @property
     def config_dir(self) -> str:
-        return os.path.join(self.base_dir, "config")
+        return self._config_dir
 
     @property
     def temp_dir(self) -> str:
-        return os.path.join(self.base_dir, "temp")
+        return self._temp_dir
@@ -28,8 +28,8 @@ def run_function(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except (errors.AutomationError, errors.BusinessError) as e:
-            raise e
+        except errors.AutomationError:  # Includes `BusinessError`
+            raise
         except Exception as exc:
             raise RuntimeError("unexpected automation error") from exc
 
@@ -50,18 +50,17 @@ def attach_reporter(func):
         try:
             return func(*args, **kwargs)
         except errors.BusinessError as e:
-            if e.code:
-                item = workitems.inputs.current
-
-                workitems.outputs.create(
-                    {
-                        "failed_wi_id": item.id,
-                        "failed_wi_code": e.code,
-                        "failed_wi_payload": item.payload,
-                    }
-                )
-
-            else:
-                raise e
+            if not e.code:
+                raise
+
+            item = workitems.inputs.current
+
+            workitems.outputs.create(
+                {
+                    "failed_wi_id": item.id,
+                    "failed_wi_code": e.code,
+                    "failed_wi_payload": item.payload,
+                }
+            )
 
     return wrapper
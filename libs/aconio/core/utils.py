@@ -1,12 +1,13 @@
 """This module contains utility functions."""
 
 import os
+import re
 import time
 import shutil
 import base64
-import locale
 
 from typing import Callable, Any
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 
 
@@ -18,13 +19,25 @@ def filter_none_and_join(lst: list, sep: str = " ") -> str:
 def cleanup_folder(temp_dir: str) -> None:
     """Remove all content from the given folder."""
 
-    for file_name in os.listdir(temp_dir):
-        file = os.path.join(temp_dir, file_name)
+    sub_dirs = []
 
-        if os.path.isfile(file) or os.path.islink(file):
-            os.remove(file)
-        elif os.path.isdir(file):
-            shutil.rmtree(file)
+    # `DirEntry` caches the file type from the directory listing, which saves
+    # a `stat` call per entry compared to `os.path.isfile/islink/isdir`
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            if entry.is_file() or entry.is_symlink():
+                os.remove(entry.path)
+            elif entry.is_dir():
+                sub_dirs.append(entry.path)
+
+    if not sub_dirs:
+        return
+
+    # Removing a directory tree is dominated by `unlink` calls, which release
+    # the GIL, so sub-directories can be removed in parallel. Consuming the
+    # results of `map` re-raises the first error that occured.
+    with ThreadPoolExecutor(max_workers=min(32, len(sub_dirs))) as executor:
+        list(executor.map(shutil.rmtree, sub_dirs))
 
 
 def url_encode(url_to_encode: str):
@@ -59,9 +72,13 @@ def b64_encode_image(path_to_file: str) -> bytes:
         return base64.b64encode(file.read())
 
 
+_EN_TO_DE_SEPARATORS = str.maketrans({",": ".", ".": ","})
+_DE_TO_FLOAT_SEPARATORS = str.maketrans({".": None, ",": "."})
+
+
 def from_german_currency_string(c: str) -> float:
     """Parse currency string to float."""
-    return float(c.replace(".", "").replace(",", "."))
+    return float(c.translate(_DE_TO_FLOAT_SEPARATORS))
 
 
 def to_german_currency_string(number: float, show_currency_symbol: bool) -> str:
@@ -81,12 +98,10 @@ def to_german_currency_string(number: float, show_currency_symbol: bool) -> str:
     Returns:
         Formatted number as string.
     """
-    try:
-        locale.setlocale(locale.LC_MONETARY, "de_DE.UTF-8")
-    except locale.Error:
-        locale.setlocale(locale.LC_MONETARY, "German_Austria.1252")
-
-    return locale.currency(number, symbol=show_currency_symbol, grouping=True)
+    # Format with English separators and swap them, which doesn't depend on
+    # (nor change) the process-wide locale
+    formatted = f"{number:,.2f}".translate(_EN_TO_DE_SEPARATORS)
+    return f"{formatted} €" if show_currency_symbol else formatted
 
 
 def replace_template_values(template_file: str, replace_values: dict[str, str]):
@@ -105,18 +120,31 @@ def replace_template_values(template_file: str, replace_values: dict[str, str]):
     Returns:
         Content of template file with all given placeholders replaced.
     """
-    with open(file=template_file, encoding="utf-8") as template_file:
-        output_file = template_file.read()
+    with open(file=template_file, encoding="utf-8") as f:
+        template = f.read()
 
-    # For each entry in dict, perform replace in file
-    for placeholder, replace_value in replace_values.items():
-        output_file = output_file.replace(placeholder, replace_value)
+    if not replace_values:
+        return template
 
-    return output_file
+    # Replace all placeholders in a single pass over the template. Longer
+    # placeholders come first, so they win over placeholders they contain.
+    pattern = re.compile(
+        "|".join(
+            re.escape(placeholder)
+            for placeholder in sorted(replace_values, key=len, reverse=True)
+        )
+    )
+    return pattern.sub(lambda match: replace_values[match[0]], template)
 
 
 def wait_until_succeeds(
-    retries: int, timeout: int, function: Callable[..., Any], *args, **kwargs
+    retries: int,
+    timeout: int,
+    function: Callable[..., Any],
+    *args,
+    retry_backoff: float = 1,
+    retry_max_delay: float = 60,
+    **kwargs,
 ) -> Any:
     """Call a function until it succeeds or `retries` is reached.
 
@@ -133,23 +161,41 @@ def wait_until_succeeds(
         *args:
             Positional arguments to pass to `function`.
 
+        retry_backoff:
+            Factor the waiting time is multiplied with after each retry, e.g.
+            `2` doubles it, so transient errors are retried quickly while a
+            struggling service is not called at a constant rate.
+            Defaults to 1 (constant waiting time). This keyword is reserved
+            and is never passed on to `function`.
+
+        retry_max_delay:
+            Amount of seconds the backoff may increase the waiting time to.
+            A larger `timeout` is not reduced. Defaults to 60. This keyword is
+            reserved and is never passed on to `function`.
+
         **kwargs:
             Keyword arguments to pass to `function`.
 
     Returns:
         The return value of the given `function`.
+
+    Raises:
+        ValueError: If `retries` is less than 1.
     """
+    if retries < 1:
+        raise ValueError("'retries' must be at least 1")
 
+    delay = timeout
     for i in range(retries):
         try:
-            res = function(*args, **kwargs)
-            break
-        except Exception as exc:  # pylint: disable=broad-except
-            if i < retries - 1:  # i is zero indexed
-                time.sleep(timeout)
-            else:
-                raise exc
-    return res
+            return function(*args, **kwargs)
+        except Exception:  # pylint: disable=broad-except
+            if i == retries - 1:  # i is zero indexed
+                raise
+
+            time.sleep(delay)
+            if delay < retry_max_delay:
+                delay = min(delay * retry_backoff, retry_max_delay)
 
 
 def wait_until_file_exits(file: str, retries: int, timeout: int = 1) -> None:
@@ -171,14 +217,20 @@ def wait_until_file_exits(file: str, retries: int, timeout: int = 1) -> None:
             If file still doesn't exist after given period of time.
     """
 
-    cnt = 0
+    # Wait for the same total time, but check in short intervals, so the
+    # function returns shortly after the file was created
+    max_wait = (retries + 1) * timeout
+    interval = min(timeout, 0.1)
+
+    deadline = time.monotonic() + max_wait
     while not os.path.exists(file):
-        time.sleep(timeout)
-        cnt += 1
-        if cnt > retries:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
             raise FileNotFoundError(
-                f'File "{file}" not found after waiting for {retries} seconds'
+                f'File "{file}" not found after waiting for '
+                f"{max_wait:g} seconds"
             )
+        time.sleep(min(interval, remaining))
 
 
 def stringify_obj_attrs(item: object, default: str = "") -> object:
@@ -193,8 +245,9 @@ def stringify_obj_attrs(item: object, default: str = "") -> object:
             Defaults to "".
     """
     for field, val in vars(item).items():
-        if val is not None:
-            setattr(item, field, str(val))
-        else:
+        if val is None:
             setattr(item, field, default)
+        elif type(val) is not str:  # pylint: disable=unidiomatic-typecheck
+            # `str` subclasses (e.g. `StrEnum`) are converted to plain `str`
+            setattr(item, field, str(val))
     return item
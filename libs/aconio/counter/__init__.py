@@ -7,12 +7,17 @@ from aconio import counter
 
 counter.config().asset_name = "processed_items_counter"
 coutner.counter().increment()
+
+# Count several items with a single update of the asset
+with counter.counter() as c:
+    for item in items:
+        ...
+        c.increment()
 ```
 
 """
 
 from __future__ import annotations
-import json
 import requests
 
 from datetime import datetime, date
@@ -22,16 +27,16 @@ from dataclasses import dataclass
 from dataclasses_json import DataClassJsonMixin
 
 from robocorp import storage
-from functools import lru_cache
+from functools import lru_cache, cached_property
 
 from aconio.counter import _config
 
-@lru_cache
+@lru_cache(maxsize=1)
 def config() -> _config.Config:
     return _config.Config()
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def counter() -> _ItemCounter:
     if config().asset_name is None:
         raise RuntimeError(
@@ -40,6 +45,12 @@ def counter() -> _ItemCounter:
     return _ItemCounter(config().asset_name)
 
 
+# Reuse the connection to the notification endpoint across notifications
+@lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    return requests.Session()
+
+
 class _ItemCounter:
     """Count processed work items for billing purposes.
 
@@ -95,16 +106,50 @@ class _ItemCounter:
     def __init__(self, asset_name: str):
         self._asset_name = asset_name
 
-    def increment(self):
-        """Increment the counter by 1.
+        # Number of currently entered `with` blocks. The counter is a shared
+        # instance, so blocks may be nested.
+        self._depth = 0
+
+        # Increments not yet written to the asset (only used within a `with`
+        # block, outside each increment is written immediately)
+        self._pending = 0
+
+    def __enter__(self) -> _ItemCounter:
+        """Defer writing increments to the asset until the block is left.
+
+        In nested blocks, all increments are written when the outermost block
+        is left.
+        """
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            pending, self._pending = self._pending, 0
+            if pending:
+                self._update(pending)
+
+    def increment(self, count: int = 1):
+        """Increment the counter by `count` (defaults to 1).
 
         If no billing periods have been created in the asset yet, a new period
         will be created automatically. Also, if the current date has surpassed
         the end date of the latest billing period, a new period will be created
         as well.
+
+        Within a `with` block, increments are summed up and written to the
+        asset with a single update when the block is left.
         """
+        if self._depth:
+            self._pending += count
+        else:
+            self._update(count)
+
+    def _update(self, count: int):
+        """Load the asset, increment it by `count` and write it back."""
         curr_counter = _Counter.from_dict(storage.get_json(self._asset_name))
-        curr_counter.increment()
+        curr_counter.increment(count)
 
         storage.set_json(self._asset_name, curr_counter.to_dict())
 
@@ -121,21 +166,23 @@ class _Period(DataClassJsonMixin):
     counter_exceeded_msg_sent: bool | None = False
     period_ending_msg_sent: bool | None = False
 
-    def increment(self):
-        """Increment the counter by 1."""
-        self.count += 1
+    def increment(self, count: int = 1):
+        """Increment the counter by `count` (defaults to 1)."""
+        self.count += count
         return self
 
-    @property
+    # The dates of a period never change, so they are only parsed once
+    @cached_property
     def start(self) -> date:
         return datetime.strptime(self.start_date, "%d.%m.%Y").date()
 
-    @property
+    @cached_property
     def end(self) -> date:
         return datetime.strptime(self.end_date, "%d.%m.%Y").date()
 
-    def is_current(self, today: date = date.today()) -> bool:
-        """Checks whether the current date is in this period."""
+    def is_current(self, today: date | None = None) -> bool:
+        """Checks whether the given date (default = today) is in this period."""
+        today = today or date.today()
         return today >= self.start and today <= self.end
 
 
@@ -152,9 +199,9 @@ class _Counter(DataClassJsonMixin):
     notification_endpoint: str | None = ""
     period_ending_msg_weeks: int | None = 3
 
-    def increment(self):
+    def increment(self, count: int = 1):
         """
-        Increment the counter of the current period by 1.
+        Increment the counter of the current period by `count` (default 1).
 
         If no billing periods have been created yet, a new period will be
         added automatically.
@@ -170,12 +217,14 @@ class _Counter(DataClassJsonMixin):
             If the counter of the updated period exceeds `max_counter`,
             a notification will be sent to the `notification_endpoint`
         """
-        curr_period = self._get_curr_period(self.periods)
+        today = date.today()
+
+        curr_period = self._get_curr_period(self.periods, today)
         if curr_period is None:
-            curr_period = self._create_period()
-            self.periods.append(curr_period.increment())
+            curr_period = self._create_period(today)
+            self.periods.append(curr_period.increment(count))
         else:
-            curr_period.increment()
+            curr_period.increment(count)
 
         if (
             curr_period.count > self.max_counter
@@ -185,35 +234,45 @@ class _Counter(DataClassJsonMixin):
             curr_period.counter_exceeded_msg_sent = True
 
         if (
-            self._period_is_ending(curr_period)
+            self._period_is_ending(curr_period, today)
             and not curr_period.period_ending_msg_sent
         ):
             self._send_notification(curr_period, "PERIOD_ABOUT_TO_END")
             curr_period.period_ending_msg_sent = True
 
-    def _create_period(self, today: date = date.today()) -> _Period:
+    def _create_period(self, today: date | None = None) -> _Period:
         """Create a new period based on the given date (default = today)."""
+        today = today or date.today()
         return _Period(
             start_date=today.strftime("%d.%m.%Y"),
             end_date=(today + relativedelta(years=1)).strftime("%d.%m.%Y"),
             count=0,
         )
 
-    def _get_curr_period(self, periods: list[_Period]) -> _Period:
-        """Return the index of the current period from a list of periods."""
-        return next((p for p in periods if p.is_current()), None)
+    def _get_curr_period(
+        self, periods: list[_Period], today: date | None = None
+    ) -> _Period:
+        """Return the period containing the given date (default = today).
+
+        New periods are only appended once the latest period has ended, so
+        only the latest period can be the current one.
+        """
+        if periods and periods[-1].is_current(today):
+            return periods[-1]
+        return None
 
-    def _period_is_ending(self, period: _Period) -> bool:
+    def _period_is_ending(
+        self, period: _Period, today: date | None = None
+    ) -> bool:
         """Checks if the period ends in the amount of weeks given in
         `period_ending_msg_weeks`.
         """
-        return (
-            period.end - date.today()
-        ).days < self.period_ending_msg_weeks * 7
+        today = today or date.today()
+        return (period.end - today).days < self.period_ending_msg_weeks * 7
 
     def _send_notification(self, period: _Period, msg: str):
         """Sends a POST request to the given notification endpoint."""
-        response = requests.post(
+        response = _session().post(
             self.notification_endpoint,
             data={
                 "process_name": self.process_name,
@@ -228,7 +287,7 @@ class _Counter(DataClassJsonMixin):
             timeout=5,
         )
 
-        if json.loads(response.text).get("status") != "success":
+        if not response.ok or response.json().get("status") != "success":
             raise RuntimeError(
                 f'Failed to notify endpoint "{self.notification_endpoint}"'
             )
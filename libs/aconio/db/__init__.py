@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import functools
+
 import pymssql
 
-from robocorp import vault
+from robocorp import log
+
+
+@functools.lru_cache(maxsize=64)
+def _read_sql_file(sql_filepath: str) -> str:
+    """Read a sql statement file (cached, since statements don't change)."""
+    # pylint: disable=unspecified-encoding
+    with open(sql_filepath, "r") as file:
+        return file.read()
 
 
 class Config:
@@ -62,6 +72,10 @@ class MSSQLConnection:
             secret_name: Name of the vault secret.
         """
 
+        # Only import `robocorp.vault` (and its HTTP client dependencies) when
+        # the configuration is actually loaded from the vault
+        from robocorp import vault  # pylint: disable=import-outside-toplevel
+
         cfg = Config()
 
         secret = vault.get_secret(secret_name)
@@ -114,16 +128,26 @@ class MSSQLConnection:
     def is_connected(self) -> bool:
         return self._conn is not None
 
-    def execute_query_from_file(self, sql_filepath: str, **kwargs) -> dict:
+    def execute_query_from_file(
+        self, sql_filepath: str, params: dict | None = None, **kwargs
+    ) -> dict:
         """Read, parse, and execute sql statement from file.
 
+        Prefer `params` for values: the database driver quotes and escapes
+        them, so they can't inject sql.
+
         Args:
             sql_filepath:
                 Path to the file containing the sql statement.
 
+            params:
+                Values bound to `%(name)s` placeholders of the sql statement
+                by the database driver. If given, literal `%` characters in
+                the statement must be escaped as `%%`. Defaults to `None`.
+
             **kwargs:
                 Named Arguments passed to the `.format()` method of the
-                sql statement string.
+                sql statement string (e.g. for table names).
 
         Returns:
             Dictionary of the result of the query.
@@ -131,13 +155,78 @@ class MSSQLConnection:
         Raises:
             RuntimeError: If the query execution fails.
         """
-        # pylint: disable=unspecified-encoding
-        with open(sql_filepath, "r") as file:
-            sql_stmt = file.read().format(**kwargs)
-            try:
-                return self._execute_sql_stmt(sql_stmt)
-            except Exception as exc:
-                raise RuntimeError(f"Failed to execute query: {exc}") from exc
+        sql_stmt = _read_sql_file(sql_filepath).format(**kwargs)
+        try:
+            return self._execute_sql_stmt(sql_stmt, params)
+        except Exception as exc:
+            raise RuntimeError(f"Failed to execute query: {exc}") from exc
+
+    def execute_many(self, sql_stmt: str, params: list[tuple | dict]) -> None:
+        """Execute a sql statement once for each set of parameters.
+
+        Note that `pymssql` still sends each execution to the database on its
+        own. All executions are committed together at the end.
+
+        Args:
+            sql_stmt:
+                Sql statement with placeholders (e.g. `%s` or `%(name)s`).
+
+            params:
+                List of parameter tuples (or dictionaries), one for each
+                execution of the statement.
+
+        Raises:
+            RuntimeError: If the statement execution fails. Executions that
+                already ran are rolled back.
+        """
+        try:
+            with self._conn.cursor() as cursor:
+                cursor.executemany(sql_stmt, params)
+            self._conn.commit()
+        except Exception as exc:
+            self._conn.rollback()
+            raise RuntimeError(f"Failed to execute statement: {exc}") from exc
+
+    def execute_script(self, sql_filepath: str, **kwargs) -> list[list[dict]]:
+        """Read, parse, and execute a sql script with multiple statements.
+
+        The whole script is sent to the database as a single batch and
+        committed at the end, instead of executing each statement on its own.
+
+        Args:
+            sql_filepath:
+                Path to the file containing the sql statements.
+
+            **kwargs:
+                Named Arguments passed to the `.format()` method of the
+                sql script string (e.g. for table names).
+
+        Returns:
+            List of the result sets of the statements which returned rows,
+            each as a list of dictionaries.
+
+        Raises:
+            RuntimeError: If the script execution fails. Statements that
+                already ran are rolled back.
+        """
+        sql_stmt = _read_sql_file(sql_filepath).format(**kwargs)
+        results = []
+        try:
+            with self._conn.cursor(as_dict=True) as cursor:
+                cursor.execute(sql_stmt)
+                while True:
+                    # Statements without a result set (e.g. `INSERT`) have
+                    # no description and cannot be fetched
+                    if cursor.description:
+                        results.append(cursor.fetchall())
+                    if not cursor.nextset():
+                        break
+            self._conn.commit()
+        except Exception as exc:
+            self._conn.rollback()
+            raise RuntimeError(f"Failed to execute script: {exc}") from exc
+
+        return results
 
     def _open_connection(self):
         """Open connection to MSSQL Database."""
@@ -148,9 +237,42 @@ class MSSQLConnection:
             self._cfg.database,
         )
 
-    def _execute_sql_stmt(self, sql_stmt: str) -> dict:
-        """Open cursor, execute the sql statement, and return result."""
+    def _execute_sql_stmt(
+        self, sql_stmt: str, params: dict | None = None
+    ) -> dict:
+        """Open cursor, execute the sql statement, and return result.
+
+        If the connection has been lost in the meantime (e.g. dropped by the
+        server), it is re-opened and the statement is executed once more. Any
+        uncommitted transaction of the lost connection is discarded by the
+        database, so its changes are not part of the new connection.
+        """
+        try:
+            return self._fetch_all(sql_stmt, params)
+        except (pymssql.InterfaceError, pymssql.OperationalError) as exc:
+            if self._is_alive():
+                raise  # The statement itself failed
+
+            log.warn(
+                f"Database connection lost ({exc}), reconnecting. Uncommitted "
+                "changes of the lost connection are discarded."
+            )
+
+        self._open_connection()
+        return self._fetch_all(sql_stmt, params)
+
+    def _fetch_all(self, sql_stmt: str, params: dict | None = None) -> dict:
         with self._conn.cursor(as_dict=True) as cursor:
-            cursor.execute(sql_stmt)
+            cursor.execute(sql_stmt, params)
 
             return cursor.fetchall()
+
+    def _is_alive(self) -> bool:
+        """Return `True` if the connection can still execute statements."""
+        try:
+            with self._conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            return True
+        except pymssql.Error:
+            return False
@@ -5,6 +5,7 @@ import time
 import functools
 import faulthandler
 
+from typing import Any, Callable
 from robocorp import windows, log
 from pynput_robocorp import keyboard
 
@@ -15,15 +16,37 @@ from aconio.dvo.ui._locators import locators
 faulthandler.disable()
 
 
-@functools.lru_cache
+@functools.lru_cache(maxsize=1)
 def _desktop() -> Desktop:
     return Desktop()
 
 
+@functools.lru_cache(maxsize=1)
+def _keyboard() -> keyboard.Controller:
+    return keyboard.Controller()
+
+
 class DVOError(Exception):
     """DVO related error."""
 
 
+def _wait_until(
+    predicate: Callable[[], bool], timeout: float, interval: float = 0.25
+) -> bool:
+    """Call `predicate` until it returns `True` or `timeout` is reached.
+
+    Returns:
+        `True` if the predicate was fulfilled, `False` on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+    return True
+
+
 def dvo_window(**kwargs) -> windows.WindowElement:
     """Return the main DVO window."""
     return windows.find_window("id:uiMain", **kwargs)
@@ -117,27 +140,94 @@ def login(
             username=username, password=password, timeout=timeout
         )
 
-    # Handle possible pop-ups
-    if handle_popups:
-        if time_popup := dvo_window().find_child_window(
-            "id:uiSelectTime", timeout=5, raise_error=False
-        ):
-            time_popup.find('name:"Abbrechen"').click()
+    _handle_login_popups(handle_popups=handle_popups)
 
-        sync_popup = dvo_window().find(
-            'subname:"Eine Synchronisation"', timeout=5, raise_error=False
-        )
-        if sync_popup:
-            sync_popup.get_parent().find('name:"OK" and class:Button').click()
 
-    # Handle release notes
-    if release_notes := dvo_window().find(
-        "id:uiReleasenotes", timeout=5, raise_error=False
-    ):
+def _handle_login_popups(handle_popups: bool, timeout: float = 5) -> None:
+    """Close the pop-ups which can appear after the DVO login.
+
+    Args:
+        handle_popups:
+            Handle time tracking and user sync pop-ups. Release notes are
+            always handled.
+        timeout:
+            Time in seconds to wait for the next pop-up to appear.
+    """
+    main_window = dvo_window()
+
+    def close_time_popup(time_popup: windows.WindowElement) -> None:
+        time_popup.find('name:"Abbrechen"').click()
+
+    def close_sync_popup(sync_popup: windows.ControlElement) -> None:
+        sync_popup.get_parent().find('name:"OK" and class:Button').click()
+
+    def close_release_notes(release_notes: windows.ControlElement) -> None:
         release_notes.log_screenshot()
         log.info("A release notes popup appeared after opening DVO, closing it")
         release_notes.find("id:cmdCancel").click()
 
+    # Functions to look up a pop-up (without waiting) and to close it
+    popups = [
+        (
+            lambda: main_window.find(
+                "id:uiReleasenotes", timeout=0, raise_error=False
+            ),
+            close_release_notes,
+        )
+    ]
+    if handle_popups:
+        popups += [
+            (
+                lambda: main_window.find_child_window(
+                    "id:uiSelectTime", timeout=0, raise_error=False
+                ),
+                close_time_popup,
+            ),
+            (
+                lambda: main_window.find(
+                    'subname:"Eine Synchronisation"',
+                    timeout=0,
+                    raise_error=False,
+                ),
+                close_sync_popup,
+            ),
+        ]
+
+    _close_popups(popups, timeout)
+
+
+def _close_popups(
+    popups: list[tuple[Callable[[], Any], Callable[[Any], None]]],
+    timeout: float,
+) -> None:
+    """Close pop-ups which may appear, in whichever order they appear.
+
+    Instead of waiting for each pop-up one after another, all expected pop-ups
+    are looked for at once. Once a pop-up has been closed, the remaining ones
+    are looked for another `timeout` seconds.
+
+    Args:
+        popups:
+            Pairs of a function returning the pop-up element if it is open
+            (without waiting for it), and a function closing the pop-up.
+        timeout:
+            Time in seconds to wait for the next pop-up to appear.
+    """
+    popups = list(popups)
+    found = []
+
+    def any_popup_open() -> bool:
+        for popup in popups:
+            if element := popup[0]():
+                found.append((popup, element))
+                return True
+        return False
+
+    while popups and _wait_until(any_popup_open, timeout):
+        popup, element = found.pop()
+        popups.remove(popup)
+        popup[1](element)
+
 
 def release_users() -> None:
     """Release all logged-in DVO users from the login screen.
@@ -154,7 +244,7 @@ def release_users() -> None:
     # Note: the locator must be identified before the `with` - for some reason
     # it does not hold down the two keys if find() is called during the `with`
     login_pic = windows.find_window("id:uiAnmeldung").find("id:picLogin")
-    with keyboard.Controller().pressed(keyboard.Key.ctrl, keyboard.Key.shift):
+    with _keyboard().pressed(keyboard.Key.ctrl, keyboard.Key.shift):
         login_pic.click()
 
     time.sleep(2)  # Wait for the user list to load
@@ -218,6 +308,7 @@ def set_filter(
     value: str,
     load_time: float = 2,
     clear_filters: bool = True,
+    enter: bool = True,
 ) -> None:
     """Set a column filter in DVO table views.
 
@@ -236,17 +327,22 @@ def set_filter(
             Defaults to 2.
         clear_filters:
             Clears all existing filters before setting the new filter.
+        enter:
+            Press "Enter" to apply the filter and wait for the table view to
+            update. If `False`, the value is only entered into the filter cell
+            and the function returns immediately. Defaults to `True`.
     """
 
     if clear_filters:
         clear_all_filters()
 
-    # AutomationID '-1' represents the filter row
-    # From there, row ID's of the actual table data start with 0
-    filter_row = group.find("control:DataItemControl and id:-1")
-    filter_row.find(f'name:"{name}"').set_value(value, enter=True)
-
-    time.sleep(load_time)
+    _set_row_filter(
+        filter_row=_filter_row(group),
+        name=name,
+        value=value,
+        load_time=load_time,
+        enter=enter,
+    )
 
 
 def set_filters(
@@ -254,6 +350,7 @@ def set_filters(
     filters: dict[str, str],
     load_time: float = 2,
     clear_filters: bool = True,
+    apply_at_once: bool = False,
 ) -> None:
     """Set multiple column filters in DVO table views.
 
@@ -270,20 +367,62 @@ def set_filters(
             Time to wait after one filter has been applied. Defaults to 2.
         clear_filters:
             Clears all existing filters before setting the new filters.
+        apply_at_once:
+            Only press "Enter" after the last filter value has been entered,
+            so the table view is only reloaded once instead of once per
+            filter. Only use this for table views which apply all entered
+            filter values on "Enter". Defaults to `False`.
     """
 
     if clear_filters:
         clear_all_filters()
 
-    for col, val in filters.items():
-        set_filter(
-            group=group,
+    filter_row = None
+    last_idx = len(filters) - 1
+    for idx, (col, val) in enumerate(filters.items()):
+        # Applying a filter reloads the table view, which can replace the
+        # filter row element, so it is only reused until a filter is applied
+        filter_row = filter_row or _filter_row(group)
+        enter = not apply_at_once or idx == last_idx
+
+        _set_row_filter(
+            filter_row=filter_row,
             name=col,
             value=val,
             load_time=load_time,
-            clear_filters=False,
+            enter=enter,
         )
 
+        if enter:
+            filter_row = None
+
+
+def _filter_row(group: windows.ControlElement) -> windows.ControlElement:
+    """Return the filter row of a DVO table view."""
+    # AutomationID '-1' represents the filter row
+    # From there, row ID's of the actual table data start with 0
+    return group.find("control:DataItemControl and id:-1")
+
+
+def _set_row_filter(
+    filter_row: windows.ControlElement,
+    name: str,
+    value: str,
+    load_time: float,
+    enter: bool,
+) -> None:
+    """Set a column filter in the given filter row (see `set_filter`)."""
+    if not enter:
+        filter_row.find(f'name:"{name}"').set_value(value)
+        return
+
+    filter_row.find(f'name:"{name}"').set_value(value, enter=True)
+
+    # The table exposes no state indicating that it finished loading. While
+    # it reloads, the row count passes through intermediate values and
+    # accessing the rows may cause COM errors, so wait for a fixed time.
+    time.sleep(load_time)
+
 
 def get_rows(group: windows.ControlElement) -> list[windows.ControlElement]:
     """Return all visible rows in a DVO table view (excluding header).
@@ -312,7 +451,9 @@ def select_all_rows(group: windows.ControlElement) -> None:
             UI element of the DVO group wrapping the table view. See library
             documentation for more information about table views and groups.
     """
-    get_rows(group=group)[0].click()  # select the first row
+    # Select the first row (data row IDs start with 0, see `set_filter`),
+    # without enumerating all rows of the table view
+    group.find("control:DataItemControl and id:0").click()
 
     # expand selection to last row
     dvo_window().send_keys("{SHIFT}{CONTROL}{END}")
@@ -375,8 +516,21 @@ def find_task(filters: dict[str, str]) -> windows.ControlElement:
     Returns:
         The identified task row within the "Aufgaben" table view.
     """
+    return _find_task(filters=filters)[0]
+
+
+def _find_task(
+    filters: dict[str, str],
+) -> tuple[windows.ControlElement, windows.WindowElement]:
+    """Return the task row (see `find_task`) and the DVO main window.
+
+    The main window is returned as well, so callers can continue with it
+    without searching the desktop for it again.
+    """
     navbar_open(category="Favoriten", locator='subname:"Aufgaben"')
-    group = dvo_window().find("id:uiAufgabenliste").find('id:"Data Area"')
+
+    main_window = dvo_window()
+    group = main_window.find("id:uiAufgabenliste").find('id:"Data Area"')
 
     set_filters(group=group, filters=filters)
 
@@ -391,7 +545,7 @@ def find_task(filters: dict[str, str]) -> windows.ControlElement:
         raise DVOError("Could not find task matching given filters!")
 
     # Open & Complete task
-    return rows[0]
+    return rows[0], main_window
 
 
 def open_task(filters: dict[str, str]) -> windows.WindowElement:
@@ -415,10 +569,10 @@ def open_task(filters: dict[str, str]) -> windows.WindowElement:
     Returns:
         The task tab window element.
     """
-    task_row = find_task(filters=filters)
+    task_row, main_window = _find_task(filters=filters)
     task_row.double_click(wait_time=2)
 
-    return dvo_window().find_child_window("id:uiAufgabDetail")
+    return main_window.find_child_window("id:uiAufgabDetail")
 
 
 def forward_task(
@@ -533,12 +687,12 @@ def open_task_attachment_menu(filters: dict[str, str]) -> windows.WindowElement:
     Returns:
         The attachment menu window element.
     """
-    task_row = find_task(filters=filters)
+    task_row, main_window = _find_task(filters=filters)
     task_row.right_click(wait_time=3)
 
     _desktop().click(locators().open_attachment)
 
-    return dvo_window().find_child_window("id:uiDokument")
+    return main_window.find_child_window("id:uiDokument")
 
 
 def open_task_attachment(filters: dict[str, str]) -> None:
@@ -731,16 +885,19 @@ def track_service(
 
     navbar_open(category="Favoriten", item="Leistungen")
 
-    dvo_window().find("id:uiLeistungenNeu").find('id:"Data Area"').right_click()
+    # Resolve the main window once for all following interactions
+    main_window = dvo_window()
 
-    dvo_window().send_keys("{DOWN}")
-    dvo_window().send_keys("{ENTER}")
+    main_window.find("id:uiLeistungenNeu").find('id:"Data Area"').right_click()
+
+    main_window.send_keys("{DOWN}")
+    main_window.send_keys("{ENTER}")
 
     # The window for tracking a new service has a very long internal load time,
     # hence the find() could case COM errors, which is why we use time.sleep()
     # here
     time.sleep(4)
-    service_window = dvo_window().find("id:ucLeistungDetail")
+    service_window = main_window.find("id:ucLeistungDetail")
     input_area = service_window.find("id:pnlInput")
 
     input_area.find("id:cboBetriebNr_EmbeddableTextBox").set_value(
@@ -762,10 +919,9 @@ def track_service(
 
     # Click "increase value" button of the "Anzahl" combobox `amount` times,
     # because `set_value` or `select` does not work on this input field
+    increase_btn = input_area.find("id:numAnzahl").find('name:"Nach oben"')
     for _ in range(amount):
-        input_area.find("id:numAnzahl").find('name:"Nach oben"').click(
-            wait_time=0.2
-        )
+        increase_btn.click(wait_time=0.2)
 
     input_area.find("id:txtText").set_value(text)
 
@@ -777,32 +933,43 @@ def track_service(
         # Click "Schließen" and accept the warning pop-up
         service_window.find("id:cmdCanel").click()
 
-        dvo_window().find('name:"Speichern"').find(
+        main_window.find('name:"Speichern"').find(
             'name:"Nein" and class:"Button"'
         ).click()
 
     else:
         save_btn.click()
 
-        vollmacht_popup = dvo_window().find(
-            'subname:"ERLEA Vollmacht fehlt"', raise_error=False, timeout=2
-        )
-        if vollmacht_popup:
+        def close_vollmacht_popup(popup: windows.ControlElement) -> None:
             log.warn('Detected "ERLEA Vollmacht" pop-up!')
-            vollmacht_popup.find('name:"OK" and class:Button').click()
+            popup.find('name:"OK" and class:Button').click()
 
-        verrechnung_pop_up_txt = dvo_window().find(
-            'subname:"Die Verrechnung der Leistungen"',
-            raise_error=False,
+        def close_verrechnung_popup(popup_txt: windows.ControlElement) -> None:
+            log.warn('Detected "Verrechnung der Leistungen" pop-up!')
+            popup_txt.get_parent().find('name:"OK" and class:Button').click()
+
+        _close_popups(
+            [
+                (
+                    lambda: main_window.find(
+                        'subname:"ERLEA Vollmacht fehlt"',
+                        timeout=0,
+                        raise_error=False,
+                    ),
+                    close_vollmacht_popup,
+                ),
+                (
+                    lambda: main_window.find(
+                        'subname:"Die Verrechnung der Leistungen"',
+                        timeout=0,
+                        raise_error=False,
+                    ),
+                    close_verrechnung_popup,
+                ),
+            ],
             timeout=2,
         )
 
-        if verrechnung_pop_up_txt:
-            log.warn('Detected "Verrechnung der Leistungen" pop-up!')
-            verrechnung_pop_up_txt.get_parent().find(
-                'name:"OK" and class:Button'
-            ).click()
-
     close_tab()
 
 
@@ -826,14 +993,41 @@ def _enter_credentials(
     """
 
     login_window = windows.find_window("id:uiAnmeldung")
-    login_window.find("id:txtUsername").set_value("")  # Clear field
-    login_window.find("id:txtUsername").send_keys(username)
-    login_window.find("id:txtPassword").set_value("")  # Clear field
-    login_window.find("id:txtPassword").send_keys(password)
+
+    username_field = login_window.find("id:txtUsername")
+    username_field.set_value("")  # Clear field
+    username_field.send_keys(username)
+
+    password_field = login_window.find("id:txtPassword")
+    password_field.set_value("")  # Clear field
+    password_field.send_keys(password)
+
     login_window.find("id:cmdAccept").click()
 
-    # Wait for the DVO window to verify that the login was successful
-    try:
-        dvo_window(timeout=timeout).find("name:Favoriten")
-    except windows.ElementNotFound as e:
-        raise DVOError("Failed to perform DVO login!") from e
+    # Return early if DVO rejects the login (e.g. because the user is logged
+    # in at another workstation), instead of waiting for the whole timeout
+    _wait_until(lambda: _is_logged_in() or _login_failed(), timeout)
+    if _login_failed():
+        raise DVOError("Failed to perform DVO login, login was rejected!")
+    if not _is_logged_in():
+        raise DVOError("Failed to perform DVO login!")
+
+
+def _is_logged_in() -> bool:
+    """Return `True` if the DVO main window shows the "Favoriten" section."""
+    main_window = dvo_window(timeout=0, raise_error=False)
+    return main_window is not None and bool(
+        main_window.find("name:Favoriten", timeout=0, raise_error=False)
+    )
+
+
+def _login_failed() -> bool:
+    """Return `True` if the DVO login window shows a failed login message."""
+    login_window = windows.find_window(
+        "id:uiAnmeldung", timeout=0, raise_error=False
+    )
+    return login_window is not None and bool(
+        login_window.find(
+            'name:"Anmeldung fehlgeschlagen"', timeout=0, raise_error=False
+        )
+    )
@@ -27,19 +27,19 @@ class DVOLocators:
         """
         return "image:" + os.path.join(self._images_folder, filename)
 
-    @property
+    @functools.cached_property
     def clear_filters(self) -> str:
         return self._image("clear_filters.png")
 
-    @property
+    @functools.cached_property
     def open_attachment(self) -> str:
         return self._image("open_attachment.png")
 
-    @property
+    @functools.cached_property
     def complete_task(self) -> str:
         return self._image("complete_task.png")
 
 
-@functools.lru_cache
+@functools.lru_cache(maxsize=1)
 def locators() -> DVOLocators:
     return DVOLocators()
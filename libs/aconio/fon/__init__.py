@@ -28,18 +28,39 @@ import requests
 from functools import lru_cache
 from dataclasses import dataclass
 
-from bs4 import BeautifulSoup
-
-from robocorp import browser
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from aconio.fon import _config
 
+_BUCHUNGEN_PATTERN = re.compile(r".*Buchungen (vom|bis).*")
+_NO_DATA_PATTERN = re.compile(r".*Keine entsprechenden Daten vorhanden*")
+_STEUERNUMMER_PATTERN = re.compile(r".*Steuernummer.*")
+_FINANZAMT_PATTERN = re.compile(r".*Finanzamt.*")
+_FINANZAMT_NUMBER_PATTERN = re.compile(r"\((\d+)\)")
+_REQUEST_KEY_PATTERN = re.compile(rb'reqkey=([^"&]+)"')
+_CSRF_TOKEN_PATTERN = re.compile(rb'name="_csrf"[^>]*?value="([^"]*)"')
+
+# Only build the elements needed from pages which are searched for a single
+# element, instead of the full document tree
+_CSRF_INPUT_STRAINER = SoupStrainer("input", attrs={"name": "_csrf"})
+_LABEL_STRAINER = SoupStrainer("label")
+
+# Removes tabs and line breaks from table cell texts in a single pass
+_REMOVE_TABS_AND_NEWLINES = str.maketrans("", "", "\t\n")
+
 
-@lru_cache  # Always return the same instance.
+@lru_cache(maxsize=1)  # Always return the same instance.
 def config() -> _config.Config:
     return _config.Config()
 
 
+# Reuse the connection to FinanzOnline across requests. Cookies are passed
+# explicitly with each request (see `_config.Authentication`).
+@lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    return requests.Session()
+
+
 def configure(teilnehmer_id: str, benutzer_id: str, pin: str) -> None:
     """Set the module configuration.
 
@@ -96,6 +117,8 @@ def download_steuerkonto_pdf(
             Include 'Rückstandsaufgliederung' section in the PDF.
     """
 
+    from playwright import sync_api  # pylint: disable=import-outside-toplevel
+
     auth = _login()
     page = _open_page(auth.cookies)
 
@@ -104,23 +127,29 @@ def download_steuerkonto_pdf(
     # Go to 'Steuerkonto' page after login was handled in the background
     # and set tax ID.
     page.goto(f"{acc_url}?reqkey={auth.request_key}")
-    page.locator('//input[@id="suchob"]').fill(steuernummer)
+    page.locator("#suchob").fill(steuernummer)
 
     # Select the checkboxes according to the given params
-    if rueckzahlungen:
-        page.locator('//input[@name="sabfrrz"]').check()
-    if anmerkungen:
-        page.locator('//input[@name="sabfranm"]').check()
-    if zahlungsplan:
-        page.locator('//input[@name="sabfrzp5"]').check()
-    if vorauszahlungen:
-        page.locator('//input[@name="sabfrvan"]').check()
-    if rueckstandsaufgliederung:
-        page.locator('//input[@name="sabfrraufgl"]').check()
+    checkboxes = {
+        "sabfrrz": rueckzahlungen,
+        "sabfranm": anmerkungen,
+        "sabfrzp5": zahlungsplan,
+        "sabfrvan": vorauszahlungen,
+        "sabfrraufgl": rueckstandsaufgliederung,
+    }
+    for name, checked in checkboxes.items():
+        if checked:
+            page.locator(f'input[name="{name}"]').check()
 
-    page.locator('//input[@name="submit"]').click()
+    page.locator('input[name="submit"]').click()
 
-    time.sleep(1)  # Wait for page to properly load before storing PDF
+    # Wait for page to properly load before storing PDF. The page may keep
+    # polling, so the network is not guaranteed to become idle. In that case
+    # the PDF is stored anyway once the timeout is reached.
+    try:
+        page.wait_for_load_state("networkidle", timeout=10_000)
+    except sync_api.TimeoutError:
+        pass
 
     # Remove the header nav bar, since it will display on each page and
     # overlap other content.
@@ -187,7 +216,6 @@ def query_steuerkonto(
         "suchob": steuernummer,
         "sabfrzp5": "true",  # enable 'Zahlungsplan'
         "sabfrrz": "true",  # enable 'Rückzahlungen'
-        "_csrf": _get_csrf_token(acc_url, auth),
     }
 
     # Add 'Zeitraum ab' parameter to query
@@ -198,43 +226,53 @@ def query_steuerkonto(
     if datum_bis is not None:
         form_data["sabfrbubtb"] = datum_bis
 
-    response = requests.post(
-        url=acc_url,
-        params={"reqkey": auth.request_key},
-        data=form_data,
-        cookies=auth.cookies,
-        timeout=10,
-    )
+    def post_query(csrf_token: str) -> requests.Response:
+        return _session().post(
+            url=acc_url,
+            params={"reqkey": auth.request_key},
+            data=form_data | {"_csrf": csrf_token},
+            cookies=auth.cookies,
+            timeout=10,
+        )
 
-    if response.status_code == 200:
+    response = post_query(auth.csrf_token or _get_csrf_token(acc_url, auth))
+
+    # The token from the login page may not be accepted for this form. In
+    # that case, retry once with the token of the 'Steuerkonto' page itself.
+    if response.status_code != 200 and auth.csrf_token:
+        response = post_query(_get_csrf_token(acc_url, auth))
 
-        account = _get_steuerkonto(response.text)
+    if response.status_code == 200:
+        # Parse the response once and share it with all extractors. The raw
+        # bytes are handed to lxml, which decodes them while parsing.
+        soup = BeautifulSoup(
+            response.content, "lxml", from_encoding=response.encoding
+        )
 
         # Check if an error occured when the query was performed.
         # e.g. wrong tax-ID will still result in a 200 status code
         # but display an error msg.
-        soup = BeautifulSoup(response.text, "html.parser")
         error_msg = soup.find("ul", attrs={"id": "fehlerAufgetretenListe"})
 
         if error_msg is not None:
             err = error_msg.text[2::]  # Remove List sign
             raise RuntimeError(err)
 
+        sections = _find_steuerkonto_sections(soup)
+
+        account = _get_steuerkonto(soup, sections.get("Buchungen"))
+
         # Get the "Buchungen" table
-        account.buchungen = _read_steuerkonto_table(
-            html=response.text,
-            region_label=re.compile(r".*Buchungen (vom|bis).*"),
-        )
+        account.buchungen = _read_steuerkonto_table(sections.get("Buchungen"))
 
         # Get the "Zahlungsplan" table
         account.zahlungsplan = _read_steuerkonto_table(
-            html=response.text, region_label="Zahlungsplan"
+            sections.get("Zahlungsplan")
         )
 
         # Get the "Rückzahlungen" table
         account.rueckzahlungen = _read_steuerkonto_table(
-            html=response.text,
-            region_label="Information zu Rückzahlungen",
+            sections.get("Rückzahlungen")
         )
 
         return account
@@ -252,37 +290,57 @@ def _login() -> _config.Authentication:
         RuntimeError: If the authentication process fails.
     """
 
-    if config().teilnehmer_id is None:
+    cfg = config()
+
+    if cfg.teilnehmer_id is None:
         raise ValueError("Missing 'Teilnehmer-ID' in the configuration.")
 
-    if config().benutzer_id is None:
+    if cfg.benutzer_id is None:
         raise ValueError("Missing 'Benutzer-ID' in the configuration.")
 
-    if config().pin is None:
+    if cfg.pin is None:
         raise ValueError("Missing 'PIN' in the configuration.")
 
     form_data = {
-        "tid": config().teilnehmer_id,
-        "benid": config().benutzer_id,
-        "pin": config().pin,
+        "tid": cfg.teilnehmer_id,
+        "benid": cfg.benutzer_id,
+        "pin": cfg.pin,
     }
 
     # Authenticate against FinanzOnline
-    login_url = f"{config().base_url}/fon/login.do"
-    response = requests.post(url=login_url, data=form_data, timeout=10)
+    login_url = f"{cfg.base_url}/fon/login.do"
+    # Don't send cookies of a previous login, so each login starts a new
+    # session and returns its own cookies
+    _session().cookies.clear()
+    response = _session().post(url=login_url, data=form_data, timeout=10)
     cookies = response.cookies
 
     # Check the response status code
     if response.status_code == 200:
         # If a 'Personifizierung' is required, handle it and re-authenticate
         if _handle_personification(response.text, cookies=cookies):
-            response = requests.post(url=login_url, data=form_data, timeout=10)
+            _session().cookies.clear()
+            response = _session().post(
+                url=login_url, data=form_data, timeout=10
+            )
             cookies = response.cookies
 
         # Obtain request key used for further authenticated requests
-        request_key = re.search(r'".*reqkey=(.*)"', response.text).group(1)
+        request_key = (
+            _REQUEST_KEY_PATTERN.search(response.content)
+            .group(1)
+            .decode("ascii")
+        )
+
+        # Pages of the logged in session already contain the CSRF token,
+        # which saves requesting it separately before each query
+        csrf_token = None
+        if match := _CSRF_TOKEN_PATTERN.search(response.content):
+            csrf_token = match.group(1).decode("ascii")
 
-        return _config.Authentication(cookies=cookies, request_key=request_key)
+        return _config.Authentication(
+            cookies=cookies, request_key=request_key, csrf_token=csrf_token
+        )
     else:
         raise RuntimeError("Failed to authenticate against FinanzOnline!")
 
@@ -300,8 +358,13 @@ def _handle_personification(
         html (str): HTML of the page after a FinanzOnline login
     """
 
-    # Parse the given HTML page
-    soup = BeautifulSoup(html, "html.parser")
+    # Skip parsing the page if it can't contain the pop-up. Only the ASCII
+    # part of the label is checked, since umlauts may be encoded as entities.
+    if "Personifizierung sofort durchf" not in html:
+        return False
+
+    # Parse the labels of the given HTML page
+    soup = BeautifulSoup(html, "lxml", parse_only=_LABEL_STRAINER)
 
     # Try to find the 'Personifizierung' pop-up
     personification_radio_btns = soup.find(
@@ -322,7 +385,9 @@ def _handle_personification(
         page.locator("[name=benid]").fill(config().benutzer_id)
         page.locator("[name=pin]").fill(config().pin)
 
-        # Wait for all values to be set properly before submitting.
+        # Wait for all values to be set properly before submitting. The
+        # login form processes the entered values in its own scripts and
+        # exposes no state to wait for, so a fixed delay is used.
         time.sleep(1.5)
         page.locator('//input[@name="submit"]').click()
 
@@ -338,10 +403,24 @@ def _handle_personification(
         return True
 
 
+@lru_cache(maxsize=1)  # Configure the browser only once.
+def _configure_browser() -> None:
+    # Playwright is only needed for the PDF download and the personification,
+    # so it is not imported together with `aconio.fon`
+    from robocorp import browser  # pylint: disable=import-outside-toplevel
+
+    browser.configure(headless=True)
+
+
 def _open_page(cookies: requests.cookies.RequestsCookieJar) -> any:
     """Opens a headless Chrome browser and sets the given cookies."""
 
-    browser.configure(headless=True)
+    from robocorp import browser  # pylint: disable=import-outside-toplevel
+
+    _configure_browser()
+
+    # `browser.context()` creates the shared context lazily and re-creates it
+    # after it was closed, so it is not cached here
     browser.context().add_cookies(
         [
             {"name": c.name, "value": c.value, "url": config().base_url}
@@ -359,14 +438,19 @@ def _get_csrf_token(url: str, auth: _config.Authentication) -> str:
     """Extract the CSRF token required for later requests."""
 
     try:
-        response_csrf = requests.get(
+        response_csrf = _session().get(
             url,
             cookies=auth.cookies,
             params={"reqkey": auth.request_key},
             timeout=10,
         )
 
-        soup = BeautifulSoup(response_csrf.text, "html.parser")
+        soup = BeautifulSoup(
+            response_csrf.content,
+            "lxml",
+            from_encoding=response_csrf.encoding,
+            parse_only=_CSRF_INPUT_STRAINER,
+        )
         csrf = soup.find("input", attrs={"name": "_csrf"})["value"]
 
     except Exception as exc:
@@ -375,28 +459,46 @@ def _get_csrf_token(url: str, auth: _config.Authentication) -> str:
     return csrf
 
 
-def _read_steuerkonto_table(html: str, region_label: str) -> list[dict] | None:
-    """Read HTML table of the 'Steuerkonto'.
+def _find_steuerkonto_sections(soup: BeautifulSoup) -> dict[str, Tag]:
+    """Find the table sections of the 'Steuerkonto' in a single pass.
 
     Args:
-        html:
-            HTML of the 'FinanzOnline Steuerkonto' page.
+        soup:
+            Parsed HTML of the 'FinanzOnline Steuerkonto' page.
 
-        region_label:
-            The `aria-label` value of the section `div` (can be regex pattern)
+    Returns:
+        Dictionary mapping 'Buchungen', 'Zahlungsplan' and 'Rückzahlungen' to
+        the first section `div` with the according `aria-label`. Sections
+        which are not found are missing in the dictionary.
+    """
+    sections = {}
+
+    for div in soup.find_all("div", attrs={"aria-label": True}):
+        label = div["aria-label"]
+
+        if _BUCHUNGEN_PATTERN.search(label):
+            sections.setdefault("Buchungen", div)
+        elif label == "Zahlungsplan":
+            sections.setdefault("Zahlungsplan", div)
+        elif label == "Information zu Rückzahlungen":
+            sections.setdefault("Rückzahlungen", div)
+
+    return sections
+
+
+def _read_steuerkonto_table(section: Tag) -> list[dict] | None:
+    """Read HTML table of the 'Steuerkonto'.
+
+    Args:
+        section:
+            The section `div` of the table (see `_find_steuerkonto_sections`).
 
     Returns:
         List of dictionaries with the extracted data.
         Each entry in the list represents a row in the table.
     """
-    soup = BeautifulSoup(html, "html.parser")
-
-    section = soup.find("div", attrs={"aria-label": region_label})
-
     # Check if section is empty
-    no_data_text = section.find(
-        "div", text=re.compile(r".*Keine entsprechenden Daten vorhanden*")
-    )
+    no_data_text = section.find("div", text=_NO_DATA_PATTERN)
 
     if no_data_text is not None:
         return None
@@ -418,18 +520,14 @@ def _read_steuerkonto_table(html: str, region_label: str) -> list[dict] | None:
         if len(columns) > 0:
             # Get the data of this row for each header (i.e. column)
             for idx, th in enumerate(headers):
-                data[th] = (
-                    columns[idx]
-                    .text.strip()
-                    .replace("\t", "")
-                    .replace("\n", "")
-                )
+                text = columns[idx].text.strip()
+                data[th] = text.translate(_REMOVE_TABS_AND_NEWLINES)
             extracted_data.append(data)
 
     return extracted_data
 
 
-def _get_steuerkonto(html: str) -> TaxAccount:
+def _get_steuerkonto(soup: BeautifulSoup, buchungen: Tag) -> TaxAccount:
     """Extract metadata from the FinanzOnline 'Steuerkonto'.
 
     Particularly, the 'Endsaldo Stand', 'Endsaldo', 'Steuernummer'
@@ -437,7 +535,8 @@ def _get_steuerkonto(html: str) -> TaxAccount:
     they will be set to `None`.
 
     Args:
-        steuerkonto_html: HTML of the 'FinanzOnline Steuerkonto'.
+        soup: Parsed HTML of the 'FinanzOnline Steuerkonto'.
+        buchungen: The 'Buchungen' section `div` of the 'Steuerkonto'.
 
     Returns:
         `TaxAccount` object.
@@ -445,29 +544,28 @@ def _get_steuerkonto(html: str) -> TaxAccount:
 
     account = TaxAccount()
 
-    soup = BeautifulSoup(html, "html.parser")
-
     # Check if 'Buchungen' section shows "keine Daten vorhanden"
     # If this is the case, the 'Endsaldo' values won't be extractable
-    no_data_text = soup.find(
-        "div", attrs={"aria-label": re.compile(r".*Buchungen (vom|bis).*")}
-    ).find("div", text=re.compile(r".*Keine entsprechenden Daten vorhanden*"))
+    no_data_text = buchungen.find("div", text=_NO_DATA_PATTERN)
     if no_data_text is not None:
         account.endsaldo_stand = None
         account.endsaldo = None
     else:
         # Get the 'Endsaldo' table
-        endsaldo_table = soup.find_all("table", attrs={"class": "table"})[2]
+        endsaldo_table = soup.find_all(
+            "table", attrs={"class": "table"}, limit=3
+        )[2]
+        endsaldo_cells = endsaldo_table.find_all("td", limit=2)
 
         # Extract the "Endsaldo Stand" date
-        account.endsaldo_stand = endsaldo_table.find_all("td")[0].text.strip()
+        account.endsaldo_stand = endsaldo_cells[0].text.strip()
 
         # Extract the "Endsaldo" value
-        account.endsaldo = endsaldo_table.find_all("td")[1].text.strip()
+        account.endsaldo = endsaldo_cells[1].text.strip()
 
     # Extract the "Steuernummer" value
     steuernummer = (
-        soup.find("div", text=re.compile(r".*Steuernummer.*"))
+        soup.find("div", text=_STEUERNUMMER_PATTERN)
         .find_next_sibling("div")
         .text.strip()
     )
@@ -475,10 +573,10 @@ def _get_steuerkonto(html: str) -> TaxAccount:
     account.steuernummer = steuernummer
 
     # Extract the "Finanzamt" number
-    finanzamt_div = soup.find("div", text=re.compile(r".*Finanzamt.*"))
+    finanzamt_div = soup.find("div", text=_FINANZAMT_PATTERN)
     finanzamt_text = finanzamt_div.find_next_sibling("div").text.strip()
 
-    match = re.search(r"\((\d+)\)", finanzamt_text)
+    match = _FINANZAMT_NUMBER_PATTERN.search(finanzamt_text)
     if match:
         account.finanzamt_number = match.group(1)
 
@@ -6,17 +6,19 @@ from dataclasses import dataclass
 import requests
 
 
+@dataclass(slots=True)
 class Config:
     """Global configurations available in `aconio.fon`."""
 
     base_url: str = "https://finanzonline.bmf.gv.at"
 
-    teilnehmer_id: str = None
-    benutzer_id: str = None
-    pin: str = None
+    teilnehmer_id: str | None = None
+    benutzer_id: str | None = None
+    pin: str | None = None
 
 
 @dataclass
 class Authentication:
     cookies: requests.cookies.RequestsCookieJar
     request_key: str
+    csrf_token: str | None = None
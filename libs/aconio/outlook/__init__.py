@@ -93,22 +93,39 @@ import time
 import functools
 import faulthandler
 
-from typing import Any
+from typing import Any, TYPE_CHECKING
 from robocorp import windows
 
-from RPA.application import COMError
-from RPA.Outlook.Application import Application as OutlookApp
-
 from aconio.core import utils
 
+if TYPE_CHECKING:
+    from RPA.Outlook.Application import Application as OutlookApp
+
 faulthandler.disable()  # Disable robocorp.windows thread warning dumps
 
 
-@functools.lru_cache  # Always return the same instance.
-def _outlook() -> OutlookApp:
+@functools.lru_cache(maxsize=1)  # Always return the same instance.
+def _outlook() -> "OutlookApp":
+    # Only import the Outlook library (and its COM dependencies) when Outlook
+    # is actually used, not whenever `aconio.outlook` is imported
+    # pylint: disable-next=import-outside-toplevel
+    from RPA.Outlook.Application import Application as OutlookApp
+
     return OutlookApp()
 
 
+@functools.lru_cache(maxsize=32)
+def _folder(account_name: str | None, folder_name: str) -> Any:
+    """Return the Outlook folder, reusing folders which were looked up before.
+
+    Looking up a folder walks the Outlook namespace via COM calls. The cache
+    is cleared by `start`, since the folders of a previous Outlook instance
+    can't be used anymore.
+    """
+    # pylint: disable=protected-access
+    return _outlook()._get_folder(account_name, folder_name)
+
+
 def start(retries: int = 3, delay: float = 5, minimize: bool = False) -> None:
     """Start the Outlook application.
 
@@ -137,6 +154,8 @@ def start(retries: int = 3, delay: float = 5, minimize: bool = False) -> None:
     except:  # pylint: disable=bare-except
         pass
 
+    _folder.cache_clear()
+
     windows.desktop().windows_run("Outlook")
 
     utils.wait_until_succeeds(
@@ -205,18 +224,21 @@ def send_email(
             folder. Defaults to `False`.
     """
 
-    if not attachments:
-        attachments = []
+    # pylint: disable-next=import-outside-toplevel
+    from RPA.application import COMError
+
+    # Resolve all paths up front, so only the COM calls remain in the loop
+    attachment_paths = [os.path.abspath(a) for a in attachments or ()]
 
     mail = _outlook().app.CreateItem(0)
-    mail.To = ";".join(to) if isinstance(to, list) else to
+    mail.To = _join_addresses(to)
     mail.Subject = subject
 
     if cc:
-        mail.CC = ";".join(cc) if isinstance(cc, list) else cc
+        mail.CC = _join_addresses(cc)
 
     if bcc:
-        mail.BCC = ";".join(bcc) if isinstance(bcc, list) else bcc
+        mail.BCC = _join_addresses(bcc)
 
     if sender:
         # Event though the property is called 'SentOnBehalfOfName', this action
@@ -230,9 +252,7 @@ def send_email(
     else:
         mail.Body = body
 
-    for attachment in attachments:
-        filepath = os.path.abspath(attachment)
-
+    for filepath in attachment_paths:
         try:
             mail.Attachments.Add(filepath)
         except COMError as exc:
@@ -250,6 +270,13 @@ def send_email(
         raise RuntimeError("Failed to send e-mail due to COMError!") from exc
 
 
+def _join_addresses(addresses: str | list[str]) -> str:
+    """Join a list of e-mail addresses the way Outlook expects them."""
+    if isinstance(addresses, (list, tuple)):
+        return ";".join(addresses)
+    return addresses
+
+
 def save_email(
     mail: Any,
     output_file_path: str,
@@ -329,8 +356,7 @@ def filter_emails(
         AttributeError:
             If the given `email_filter` is invalid.
     """
-    # pylint: disable=protected-access
-    folder = _outlook()._get_folder(account_name, folder_name)
+    folder = _folder(account_name, folder_name)
     folder_mails = folder.Items if folder else []
 
     try:
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import os
 import time
+import zlib
 import queue
 import threading
 
@@ -26,7 +27,7 @@ import numpy as np
 import pynput.mouse
 
 
-@functools.lru_cache  # Always return the same instance.
+@functools.lru_cache(maxsize=1)  # Always return the same instance.
 def recorder() -> _Recorder:
     return _Recorder()
 
@@ -75,7 +76,7 @@ class _Recorder:
             self.height = int(self.monitor["height"] * self.scale)
 
         self.max_frame = self.fps * int(max_length)
-        self.buffer = queue.Queue()
+        self.buffer = queue.SimpleQueue()
 
         self.stop_capture = threading.Event()
 
@@ -102,9 +103,13 @@ class _Recorder:
 
     def _write_file(self):
         cur_frame = 0
-        prev_frame = None
         out_frame = None
 
+        # Output buffers reused for every frame, instead of allocating new
+        # full-size frames for each operation
+        resized = np.empty((self.height, self.width, 4), dtype=np.uint8)
+        bgr_frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+
         fourcc = cv2.VideoWriter_fourcc(*"VP80")
 
         with _SuppressStderr():
@@ -117,22 +122,26 @@ class _Recorder:
             if data is None:
                 break
 
-            ts, img, mouse = data
-            frame = np.array(img)
+            ts, frame, mouse = data
 
-            if self.force_fps:
+            if self.force_fps and out_frame is not None:
+                # Repeat the last written frame (without converting it again)
+                # until the video catches up with the capture time
                 while ts > (cur_frame + 1) / self.fps:
                     cur_frame += 1
                     out.write(out_frame)
-            else:
-                if prev_frame is not None and (prev_frame == frame).all():
-                    continue
 
             cur_frame += 1
-            prev_frame = frame
 
-            frame = cv2.resize(frame, (self.width, self.height))
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+            # Convert the colors after resizing, so fewer pixels are converted
+            # when downscaling. Frames which already have the output size
+            # (i.e. `scale` is 1) are not resized at all.
+            height, width = frame.shape[:2]
+            if (width, height) != (self.width, self.height):
+                frame = cv2.resize(
+                    frame, (self.width, self.height), dst=resized
+                )
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR, dst=bgr_frame)
 
             x, y = mouse
             if self.left <= x < self.right and self.top <= y < self.bottom:
@@ -160,25 +169,41 @@ class _Recorder:
         mouse = pynput.mouse.Controller()
         with mss.mss() as sct:
             frame_number = 0
+            prev_checksum = None
             start_time = time.time()
 
             while not self.stop_capture.is_set():
+                # Sleep once until the next frame is due instead of polling.
+                # Since Python 3.11, `time.sleep` uses a high-resolution timer
+                # on Windows.
                 trigger_time = start_time + frame_number / self.fps
-                while time.time() < trigger_time:
-                    time.sleep(0.001)
+                delay = trigger_time - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+
+                # Get raw pixels from the screen. Every grab returns a new
+                # buffer, so the Numpy array can be a view on it instead of
+                # a copy.
+                img = sct.grab(self.monitor)
+                frame_number += 1
 
-                # Get raw pixels from the screen, save it to a Numpy array
-                # frame = np.array(sct.grab(self.monitor))
+                # Unless each frame must be written, unchanged frames are
+                # dropped before they are passed to the writer. Checksums are
+                # compared instead of all pixels, which also saves keeping the
+                # previous frame around.
+                if not self.force_fps:
+                    checksum = zlib.crc32(img.raw)
+                    if checksum == prev_checksum:
+                        continue
+                    prev_checksum = checksum
+
+                frame = np.frombuffer(img.raw, dtype=np.uint8).reshape(
+                    img.height, img.width, 4
+                )
                 self.buffer.put_nowait(
-                    (
-                        time.time() - start_time,
-                        sct.grab(self.monitor),
-                        mouse.position,
-                    )
+                    (time.time() - start_time, frame, mouse.position)
                 )
 
-                frame_number += 1
-
         self.buffer.put_nowait(None)
 
 
@@ -194,19 +219,18 @@ class _SuppressStderr(object):
 
     """
 
-    def __init__(self):
-        # Open a null file
-        self.null_fd = os.open(os.devnull, os.O_RDWR)
+    def __enter__(self):
         # Save the actual stderr (2) file descriptor.
         self.save_fd = os.dup(2)
-
-    def __enter__(self):
         # Assign the null pointer to stderr.
-        os.dup2(self.null_fd, 2)
+        os.dup2(_devnull_fd(), 2)
 
     def __exit__(self, *_):
         # Re-assign the real stderr back to (2)
         os.dup2(self.save_fd, 2)
-        # Close all file descriptors
-        os.close(self.null_fd)
         os.close(self.save_fd)
+
+
+@functools.lru_cache(maxsize=1)  # Open the null file only once.
+def _devnull_fd() -> int:
+    return os.open(os.devnull, os.O_WRONLY)
@@ -15,6 +15,13 @@ from bot import _items, _config
 
 faulthandler.disable()
 
+# Bot module holding the `config`, `setup` and `teardown` functions of a task
+_TASK_MODULES = {
+    "producer": bot.producer,
+    "consumer": bot.consumer,
+    "reporter": bot.reporter,
+}
+
 
 @tasks.setup(scope="task")
 def before_each(tsk):
@@ -23,27 +30,15 @@ def before_each(tsk):
     # is required
     botdata.create("<process_name>")  # Temporary robot directory
 
-    match tsk.name:
-        case "producer":
-            _config.dump(bot.producer.config())
-            bot.producer.setup()
-        case "consumer":
-            _config.dump(bot.consumer.config())
-            bot.consumer.setup()
-        case "reporter":
-            _config.dump(bot.reporter.config())
-            bot.reporter.setup()
+    if module := _TASK_MODULES.get(tsk.name):
+        _config.dump(module.config())
+        module.setup()
 
 
 @tasks.teardown(scope="task")
 def after_each(tsk):
-    match tsk.name:
-        case "producer":
-            bot.producer.teardown()
-        case "consumer":
-            bot.consumer.teardown()
-        case "reporter":
-            bot.reporter.teardown()
+    if module := _TASK_MODULES.get(tsk.name):
+        module.teardown()
 
 
 @tasks.task
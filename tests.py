@@ -12,3 +12,28 @@ faulthandler.disable()
 def test_generic() -> None:
     """Template for quickly testing throughout the development process."""
     pass
+
+
+@tasks.task
+def test_counter_nested_blocks() -> None:
+    """Increments of nested `counter` blocks are written once, when the
+    outermost block is left."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from aconio import counter
+
+    updates = []
+    item_counter = counter._ItemCounter("test_asset")
+    item_counter._update = updates.append  # Don't write to Control Room
+
+    with item_counter as outer:
+        outer.increment()
+        outer.increment()
+        with item_counter as inner:
+            inner.increment()
+        assert not updates, "Inner block must not write the counter"
+        outer.increment()
+
+    assert updates == [4], f"Expected a single update of 4, got {updates}"
+
+    item_counter.increment()
+    assert updates == [4, 1], "Increments outside a block must be written"